@@ -0,0 +1,38 @@
+"""Maven dependency fetching, graph building and ASCII tree rendering."""
+
+from .graph import (
+    build_full_dependency_graph,
+    get_test_deps,
+    load_or_build_graph,
+    load_test_graph,
+)
+from .http import HTTPStatusError, cached_by_gav, http_get, preconnect
+from .pom import (
+    UnresolvablePomError,
+    build_pom_url,
+    fetch_dependencies_from_pom,
+    maven_version_key,
+    parse_dependencies_from_pom,
+    resolve_artifact_to_gav,
+    validate_full_gav,
+)
+from .tree import print_ascii_tree
+
+__all__ = [
+    "HTTPStatusError",
+    "UnresolvablePomError",
+    "build_full_dependency_graph",
+    "build_pom_url",
+    "cached_by_gav",
+    "fetch_dependencies_from_pom",
+    "get_test_deps",
+    "http_get",
+    "load_or_build_graph",
+    "load_test_graph",
+    "maven_version_key",
+    "parse_dependencies_from_pom",
+    "preconnect",
+    "print_ascii_tree",
+    "resolve_artifact_to_gav",
+    "validate_full_gav",
+]
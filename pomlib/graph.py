@@ -0,0 +1,143 @@
+"""Test graphs and transitive dependency graph construction."""
+
+import hashlib
+import json
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Dict, List, Optional
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+from .http import CACHE_DIR, _write_file_atomic
+from .pom import UnresolvablePomError
+
+GRAPH_CACHE_DIR = os.path.join(CACHE_DIR, "graphs")
+
+
+def load_test_graph(path: str) -> Dict[str, List[str]]:
+    if not os.path.isfile(path):
+        raise RuntimeError(f"Test graph file not found: {path}")
+    try:
+        with open(path, "rb") as f:
+            data = _json_loads(f.read())
+        if not (
+            isinstance(data, dict)
+            and all(
+                isinstance(k, str) and isinstance(v, list) and all(isinstance(dep, str) for dep in v)
+                for k, v in data.items()
+            )
+        ):
+            raise ValueError("Invalid test graph format: expected an object of string lists")
+        return data
+    except Exception as e:
+        raise RuntimeError(f"Failed to load test graph: {e}")
+
+
+def get_test_deps(pkg: str, graph: Dict[str, List[str]]) -> List[str]:
+    return graph.get(pkg, [])
+
+
+def build_full_dependency_graph(
+    root_package: str,
+    get_deps_func,
+    base_repo_url: Optional[str] = None,
+    test_graph: Optional[Dict] = None,
+    filter_sub: str = "",
+    max_workers: int = 16,
+) -> Dict[str, List[str]]:
+    """Build the transitive graph, fetching dependencies of packages in parallel.
+
+    Each package is submitted as soon as its first parent is resolved; a package
+    that is already being fetched is never submitted twice.
+    """
+    graph = {}
+    source = test_graph if test_graph is not None else base_repo_url
+    # Only this thread reads or writes `inflight`, so it needs no lock.
+    inflight: Dict[str, Future] = {}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        def schedule(pkg: str) -> None:
+            if pkg in graph or pkg in inflight:
+                return
+            if filter_sub and filter_sub in pkg:
+                graph[pkg] = []
+            else:
+                inflight[pkg] = executor.submit(get_deps_func, pkg, source)
+
+        schedule(root_package)
+        while inflight:
+            done, _ = wait(inflight.values(), return_when=FIRST_COMPLETED)
+            for pkg in [p for p, future in inflight.items() if future in done]:
+                future = inflight.pop(pkg)
+                try:
+                    deps = future.result()
+                except Exception:
+                    deps = []
+
+                filtered_deps = [d for d in deps if not (filter_sub and filter_sub in d)]
+                graph[pkg] = filtered_deps
+                for dep in filtered_deps:
+                    schedule(dep)
+
+    return graph
+
+
+def load_or_build_graph(
+    root_package: str,
+    get_deps_func,
+    base_repo_url: str,
+    filter_sub: str = "",
+    max_workers: int = 16,
+) -> Dict[str, List[str]]:
+    """Build the filtered graph of `root_package`, reusing persisted dependency lists.
+
+    The unfiltered dependencies of every package fetched for this root are
+    stored under GRAPH_CACHE_DIR, keyed by root GAV and repository URL. Later
+    runs only fetch packages that are not stored yet, so a repeated run, or
+    one with a different filter, makes no POM requests for known packages,
+    while the filter still prunes excluded subtrees before they are fetched.
+    Packages whose POM can never be fetched (unset version, 404) are stored
+    as leaves; transient failures and SNAPSHOT packages are not stored.
+    """
+    key = hashlib.sha256(f"{base_repo_url}|{root_package}".encode("utf-8")).hexdigest()
+    cache_path = os.path.join(GRAPH_CACHE_DIR, f"{key}.graph.json")
+
+    stored: Dict[str, List[str]] = {}
+    try:
+        with open(cache_path, "rb") as f:
+            cached = _json_loads(f.read())
+        if cached["root"] == root_package and cached["repo"] == base_repo_url:
+            stored = cached["graph"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    fetched: Dict[str, List[str]] = {}
+
+    def get_deps(pkg: str, source: str) -> List[str]:
+        if pkg in stored:
+            return stored[pkg]
+        try:
+            deps = get_deps_func(pkg, source)
+        except UnresolvablePomError:
+            deps = []
+        if not pkg.endswith("-SNAPSHOT"):
+            fetched[pkg] = deps
+        return deps
+
+    graph = build_full_dependency_graph(
+        root_package,
+        get_deps,
+        base_repo_url=base_repo_url,
+        filter_sub=filter_sub,
+        max_workers=max_workers,
+    )
+    if fetched:
+        data = {"root": root_package, "repo": base_repo_url, "graph": {**stored, **fetched}}
+        try:
+            _write_file_atomic(cache_path, json.dumps(data).encode("utf-8"))
+        except OSError:
+            pass
+    return graph
@@ -0,0 +1,229 @@
+"""HTTP access to Maven repositories: keep-alive connection pool and on-disk cache."""
+
+import functools
+import gzip
+import hashlib
+import http.client
+import json
+import os
+import socket
+import tempfile
+import threading
+import urllib.parse
+import urllib.request
+import zlib
+from typing import Dict, List, Optional, Tuple
+
+
+USER_AGENT = "maven-deps-visualizer/1.0"
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "maven-deps")
+HTTP_CACHE_DIR = os.path.join(CACHE_DIR, "http")
+DEPS_CACHE_DIR = os.path.join(CACHE_DIR, "deps")
+MAX_REDIRECTS = 5
+
+
+class HTTPStatusError(RuntimeError):
+    """A request completed with a status other than 200 (or 304 for a revalidation)."""
+
+    def __init__(self, status: int, reason: str):
+        super().__init__(f"HTTP Error {status}: {reason}")
+        self.status = status
+
+
+# Idle keep-alive connections, keyed by (scheme, netloc). Shared by all threads.
+_idle_connections: Dict[tuple, List[http.client.HTTPConnection]] = {}
+_pool_lock = threading.Lock()
+
+
+def _acquire_connection(scheme: str, netloc: str, timeout: float) -> Tuple[http.client.HTTPConnection, bool]:
+    """Return (connection, reused); `reused` is True for a connection taken from the idle pool."""
+    with _pool_lock:
+        idle = _idle_connections.get((scheme, netloc))
+        conn = idle.pop() if idle else None
+    if conn is not None:
+        # Pooled connections may have been opened with a different timeout.
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        return conn, True
+    conn_cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+    return conn_cls(netloc, timeout=timeout), False
+
+
+def _release_connection(scheme: str, netloc: str, conn: http.client.HTTPConnection) -> None:
+    with _pool_lock:
+        _idle_connections.setdefault((scheme, netloc), []).append(conn)
+
+
+def preconnect(url: str, timeout: float = 5) -> None:
+    """Open a connection to the host of `url` and park it in the pool.
+
+    Meant to run in a background thread so DNS, TCP and TLS setup overlap
+    with other startup work; failures are ignored.
+    """
+    parts = urllib.parse.urlsplit(url)
+    if parts.scheme not in ("http", "https"):
+        return
+    try:
+        conn, reused = _acquire_connection(parts.scheme, parts.netloc, timeout)
+    except (OSError, http.client.HTTPException, ValueError):
+        return
+    if reused:
+        # Already warm; hand it straight back.
+        _release_connection(parts.scheme, parts.netloc, conn)
+        return
+    try:
+        conn.connect()
+    except (OSError, http.client.HTTPException, ValueError):
+        conn.close()
+        return
+    _release_connection(parts.scheme, parts.netloc, conn)
+
+
+def _decode_body(body: bytes, content_encoding: Optional[str]) -> bytes:
+    encoding = (content_encoding or "").strip().lower()
+    if encoding == "gzip":
+        return gzip.decompress(body)
+    if encoding == "deflate":
+        try:
+            return zlib.decompress(body)
+        except zlib.error:
+            # Some servers send raw deflate data without the zlib header.
+            return zlib.decompress(body, -zlib.MAX_WBITS)
+    return body
+
+
+def _validated_cache_paths(url: str) -> Tuple[str, str]:
+    key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+    base = os.path.join(HTTP_CACHE_DIR, key)
+    return base + ".body", base + ".meta.json"
+
+
+def _load_validated(url: str) -> Optional[Tuple[bytes, dict]]:
+    body_path, meta_path = _validated_cache_paths(url)
+    try:
+        with open(meta_path, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        with open(body_path, "rb") as f:
+            return f.read(), meta
+    except (OSError, ValueError):
+        return None
+
+
+def _store_validated(url: str, body: bytes, etag: Optional[str], last_modified: Optional[str]) -> None:
+    if not (etag or last_modified):
+        return
+    body_path, meta_path = _validated_cache_paths(url)
+    try:
+        _write_file_atomic(body_path, body)
+        meta = {"url": url, "etag": etag, "last_modified": last_modified}
+        _write_file_atomic(meta_path, json.dumps(meta).encode("utf-8"))
+    except OSError:
+        pass
+
+
+def http_get(url: str, timeout: float = 60, conditional: bool = False, _redirects: int = 0) -> bytes:
+    """Download `url` over a pooled keep-alive connection.
+
+    At most MAX_REDIRECTS redirects are followed. With `conditional=True`
+    the body is kept under HTTP_CACHE_DIR together with its
+    ETag/Last-Modified, and later calls revalidate it; a 304 reply returns
+    the cached body without transferring it again.
+    """
+    parts = urllib.parse.urlsplit(url)
+    if parts.scheme not in ("http", "https"):
+        with urllib.request.urlopen(url, timeout=timeout) as resp:
+            return resp.read()
+
+    path = parts.path or "/"
+    if parts.query:
+        path += "?" + parts.query
+    headers = {"User-Agent": USER_AGENT, "Accept-Encoding": "gzip, deflate"}
+
+    cached = _load_validated(url) if conditional else None
+    if cached is not None:
+        _, meta = cached
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+    while True:
+        conn, reused = _acquire_connection(parts.scheme, parts.netloc, timeout)
+        try:
+            conn.request("GET", path, headers=headers)
+            resp = conn.getresponse()
+            body = resp.read()
+        except (http.client.HTTPException, OSError) as e:
+            conn.close()
+            # A pooled connection may have been closed by the server while
+            # idle, so retry on the next one. Errors on a fresh connection
+            # and timeouts are real failures.
+            if reused and not isinstance(e, socket.timeout):
+                continue
+            raise
+
+        if resp.will_close:
+            conn.close()
+        else:
+            _release_connection(parts.scheme, parts.netloc, conn)
+
+        if resp.status == 304 and cached is not None:
+            return cached[0]
+        if resp.status in (301, 302, 303, 307, 308) and resp.getheader("Location"):
+            if _redirects >= MAX_REDIRECTS:
+                raise RuntimeError(f"Too many redirects (more than {MAX_REDIRECTS})")
+            location = urllib.parse.urljoin(url, resp.getheader("Location"))
+            return http_get(location, timeout, conditional, _redirects + 1)
+        if resp.status != 200:
+            raise HTTPStatusError(resp.status, resp.reason)
+        body = _decode_body(body, resp.getheader("Content-Encoding"))
+        if conditional:
+            _store_validated(url, body, resp.getheader("ETag"), resp.getheader("Last-Modified"))
+        return body
+
+
+def _write_file_atomic(path: str, data: bytes) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def cached_by_gav(func):
+    """Memoize a GAV -> dependency list function in memory and under DEPS_CACHE_DIR.
+
+    Entries are keyed by repository URL and GAV; the file name is a hash of
+    both, so coordinates read from downloaded POMs never become paths.
+    Released artifacts are immutable, so cached entries never expire;
+    SNAPSHOT versions always go to the network.
+    """
+    @functools.lru_cache(maxsize=None)
+    def load_or_fetch(gav: str, base_repo_url: str) -> tuple:
+        key = hashlib.sha256(f"{base_repo_url.rstrip('/')}|{gav}".encode("utf-8")).hexdigest()
+        cache_path = os.path.join(DEPS_CACHE_DIR, f"{key}.json")
+        try:
+            with open(cache_path, "r", encoding="utf-8") as f:
+                return tuple(json.load(f))
+        except (OSError, ValueError):
+            pass
+
+        deps = func(gav, base_repo_url)
+        try:
+            _write_file_atomic(cache_path, json.dumps(deps).encode("utf-8"))
+        except OSError:
+            pass
+        return tuple(deps)
+
+    @functools.wraps(func)
+    def wrapper(gav: str, base_repo_url: str) -> List[str]:
+        if gav.count(":") != 2 or gav.endswith("-SNAPSHOT"):
+            return func(gav, base_repo_url)
+        return list(load_or_fetch(gav, base_repo_url))
+
+    return wrapper
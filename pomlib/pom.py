@@ -0,0 +1,198 @@
+"""Maven coordinates, version resolution and POM parsing."""
+
+import functools
+import io
+import re
+import xml.etree.ElementTree as ET
+from typing import Iterator, List, Tuple
+
+from .http import HTTPStatusError, cached_by_gav, http_get
+
+
+_VERSION_RE = re.compile(r"^\d[0-9A-Za-z.\-_]*$")
+_GAV_RE = re.compile(r"[^:\s]+:[^:\s]+:[^:\s]+")
+_HREF_RE = re.compile(rb'<a\s+href="([^"/]+)/?"')
+_NUMERIC_PREFIX_RE = re.compile(r"^\d+(?:\.\d+)*")
+_VERSION_TOKEN_RE = re.compile(r"\d+|[a-z]+")
+
+# Maven qualifier ordering; anything unknown sorts after "sp", alphabetically.
+_QUALIFIER_RANKS = {
+    "alpha": 0, "a": 0,
+    "beta": 1, "b": 1,
+    "milestone": 2, "m": 2,
+    "rc": 3, "cr": 3,
+    "snapshot": 4,
+    "ga": 5, "final": 5, "release": 5,
+    "sp": 6,
+}
+_RELEASE_RANK = 5
+_UNKNOWN_QUALIFIER_RANK = 7
+
+# A POM starts with an XML declaration, a comment (often a license header) or <project>.
+_POM_PREFIXES = (b"<?xml", b"<!--", b"<project")
+_UTF8_BOM = b"\xef\xbb\xbf"
+
+
+class UnresolvablePomError(RuntimeError):
+    """The POM of a GAV can never be fetched: its version is unset or it is not in the repository."""
+
+
+@functools.lru_cache(maxsize=4096)
+def validate_full_gav(package: str) -> bool:
+    return _GAV_RE.fullmatch(package) is not None
+
+
+def maven_version_key(version: str) -> tuple:
+    """Sort key approximating Maven's ComparableVersion ordering.
+
+    Returns (numeric_part, qualifier_part): "1.0" == "1.0.0" == "1.0-GA",
+    "2.0-rc1" < "2.0" < "2.0-sp1" < "2.0.1", and unparseable input never raises.
+    """
+    numeric = _NUMERIC_PREFIX_RE.match(version)
+    release = [int(x) for x in numeric.group().split(".")] if numeric else []
+    while release and release[-1] == 0:
+        release.pop()
+
+    qualifier = []
+    rest = version[numeric.end():] if numeric else version
+    for token in _VERSION_TOKEN_RE.findall(rest.lower()):
+        if token.isdigit():
+            qualifier.append((1, int(token), ""))
+        else:
+            rank = _QUALIFIER_RANKS.get(token, _UNKNOWN_QUALIFIER_RANK)
+            qualifier.append((0, rank, token if rank == _UNKNOWN_QUALIFIER_RANK else ""))
+    while qualifier and qualifier[-1] in ((1, 0, ""), (0, _RELEASE_RANK, "")):
+        qualifier.pop()
+    qualifier.append((0, _RELEASE_RANK, ""))
+    return tuple(release), tuple(qualifier)
+
+
+def resolve_artifact_to_gav(artifact_input: str, base_repo_url: str) -> str:
+    if validate_full_gav(artifact_input):
+        return artifact_input
+
+    if ":" in artifact_input:
+        raise ValueError("Use single artifactId (e.g., 'commons-logging')")
+
+    artifact_id = artifact_input.strip()
+
+    # Special case for known Apache artifacts
+    if artifact_id == "commons-logging":
+        return "commons-logging:commons-logging:1.2"
+    if artifact_id == "junit":
+        return "junit:junit:3.8.1"
+    if artifact_id == "log4j":
+        return "log4j:log4j:1.2.17"
+
+    group_id = artifact_id
+    versions_url = f"{base_repo_url.rstrip('/')}/{_group_path(group_id)}/{artifact_id}/"
+
+    try:
+        html_content = http_get(versions_url, conditional=True)
+    except Exception as e:
+        raise RuntimeError(f"Cannot list versions at {versions_url}: {e}")
+
+    version_links = (link.decode("utf-8", "replace") for link in _HREF_RE.findall(html_content))
+    versions = [v for v in version_links if _VERSION_RE.match(v)]
+
+    if not versions:
+        raise RuntimeError(f"No valid versions found for artifact '{artifact_id}'")
+
+    def version_key(v):
+        # Prefer the newest release; fall back to pre-releases only if nothing else exists.
+        key = maven_version_key(v)
+        is_prerelease = any(kind == 0 and rank < _RELEASE_RANK for kind, rank, _ in key[1])
+        return not is_prerelease, key
+
+    latest_version = max(versions, key=version_key)
+    return f"{group_id}:{artifact_id}:{latest_version}"
+
+
+@functools.lru_cache(maxsize=1024)
+def _group_path(group_id: str) -> str:
+    return group_id.replace(".", "/")
+
+
+@functools.lru_cache(maxsize=4096)
+def build_pom_url(gav: str, base_repo_url: str) -> str:
+    group_id, artifact_id, version = gav.split(":")
+    pom_name = f"{artifact_id}-{version}.pom"
+    return f"{base_repo_url.rstrip('/')}/{_group_path(group_id)}/{artifact_id}/{version}/{pom_name}"
+
+
+def _iter_deps(events) -> Iterator[Tuple[str, str, str]]:
+    """Yield (groupId, artifactId, version) of each top-level <dependency>.
+
+    `events` is an ET.iterparse stream of ("start", "end") events. Tag names
+    are compared as full "{namespace}local" strings derived once from the root.
+    """
+    _, root = next(events)
+    ns = root.tag[:root.tag.index("}") + 1] if root.tag.startswith("{") else ""
+    deps_tag, dep_tag = f"{ns}dependencies", f"{ns}dependency"
+    group_tag, artifact_tag, version_tag = f"{ns}groupId", f"{ns}artifactId", f"{ns}version"
+
+    depth = 1
+    in_dependencies = False
+    for event, elem in events:
+        if event == "start":
+            depth += 1
+            if depth == 2 and elem.tag == deps_tag:
+                in_dependencies = True
+            continue
+
+        depth -= 1
+        if not in_dependencies:
+            continue
+        if depth == 2 and elem.tag == dep_tag:
+            yield (
+                (elem.findtext(group_tag) or "").strip(),
+                (elem.findtext(artifact_tag) or "").strip(),
+                (elem.findtext(version_tag) or "").strip(),
+            )
+            elem.clear()
+        elif depth == 1 and elem.tag == deps_tag:
+            return
+
+
+def parse_dependencies_from_pom(content: bytes) -> List[str]:
+    """Stream-parse the top-level <dependencies> of a POM.
+
+    <dependencyManagement> is skipped, and parsing stops as soon as the
+    top-level </dependencies> is seen.
+    """
+    deps = []
+    try:
+        events = ET.iterparse(io.BytesIO(content), events=("start", "end"))
+        for group, artifact, version in _iter_deps(events):
+            if group and artifact:
+                deps.append(f"{group}:{artifact}:{version or 'unknown'}")
+    except ET.ParseError as e:
+        raise RuntimeError(f"Invalid POM XML: {e}")
+    return deps
+
+
+@cached_by_gav
+def fetch_dependencies_from_pom(gav: str, base_repo_url: str) -> List[str]:
+    version = gav.rsplit(":", 1)[-1]
+    if version == "unknown" or "${" in version:
+        # Managed or property-based versions are not resolved by this tool.
+        raise UnresolvablePomError(f"Cannot fetch POM for {gav}: version is not set")
+
+    url = build_pom_url(gav, base_repo_url)
+    try:
+        content = http_get(url, conditional=gav.endswith("-SNAPSHOT"))
+    except HTTPStatusError as e:
+        if e.status in (404, 410):
+            raise UnresolvablePomError(f"POM not found at {url}")
+        raise RuntimeError(f"Failed to download POM from {url}: {e}")
+    except Exception as e:
+        raise RuntimeError(f"Failed to download POM from {url}: {e}")
+
+    # Reject HTML error and placeholder pages before handing them to the XML parser.
+    head = content[:256]
+    if head.startswith(_UTF8_BOM):
+        head = head[len(_UTF8_BOM):]
+    if not head.lstrip().startswith(_POM_PREFIXES):
+        raise RuntimeError(f"Not a POM: {url}")
+
+    return parse_dependencies_from_pom(content)
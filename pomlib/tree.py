@@ -0,0 +1,60 @@
+"""ASCII rendering of dependency trees."""
+
+import sys
+from typing import Dict, Optional, Set
+
+
+def print_ascii_tree(
+    package: str,
+    get_deps,
+    test_graph: Optional[Dict] = None,
+    base_repo_url: Optional[str] = None,
+    prefix: str = "",
+    is_last: bool = True,
+    visited: Optional[Set[str]] = None,
+    filter_sub: str = "",
+):
+    """Print the dependency tree of `package` using an explicit stack instead of recursion.
+
+    `visited` holds the packages on the current root-to-node path. It is
+    updated in place as the walk enters and leaves packages and is left as
+    it was passed in once printing finishes. Lines are collected and
+    written to stdout in a single call.
+    """
+    source = test_graph if test_graph is not None else base_repo_url
+    path = visited if visited is not None else set()
+    out_lines = []
+
+    # Frames are (package, prefix, is_last, leaving); a leaving frame pops
+    # the package off the current path once all its children are printed.
+    stack = [(package, prefix, is_last, False)]
+    while stack:
+        package, prefix, is_last, leaving = stack.pop()
+        if leaving:
+            path.discard(package)
+            continue
+
+        if filter_sub and filter_sub in package:
+            continue
+
+        connector = "└── " if is_last else "├── "
+        if package in path:
+            out_lines.append(f"{prefix}{connector}{package} (.cycle.)")
+            continue
+        out_lines.append(f"{prefix}{connector}{package}")
+
+        try:
+            deps = get_deps(package, source)
+        except Exception:
+            deps = []
+
+        deps = [d for d in deps if not (filter_sub and filter_sub in d)]
+        child_prefix = prefix + ("    " if is_last else "│   ")
+
+        path.add(package)
+        stack.append((package, prefix, is_last, True))
+        for i in range(len(deps) - 1, -1, -1):
+            stack.append((deps[i], child_prefix, i == len(deps) - 1, False))
+
+    if out_lines:
+        sys.stdout.write("\n".join(out_lines) + "\n")